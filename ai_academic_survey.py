@@ -1,12 +1,21 @@
 import csv
+import io
+import os
 import statistics
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
 RESPONSES_FILE = "survey_responses.csv"
+INDEX_FILE = "survey_responses.idx"
 RESULTS_FILE = "survey_results.csv"
+TRENDS_FILE = "survey_trends.csv"
+RELIABILITY_FILE = "survey_reliability.csv"
+CORRELATIONS_FILE = "survey_correlations.csv"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 DEMOGRAPHIC_QUESTIONS = [
     {"text": "What is your name? (Optional): ", "required": False},
@@ -49,6 +58,8 @@ SURVEY_QUESTIONS = {
 
 LIKERT_SCALE = ["1 - Strongly Disagree", "2 - Disagree", "3 - Agree", "4 - Strongly Agree"]
 
+ITEM_COUNT = sum(len(questions) for questions in SURVEY_QUESTIONS.values())
+
 def save_responses(data):
     try:
         file_exists = False
@@ -56,6 +67,7 @@ def save_responses(data):
             file_exists = True
     except FileNotFoundError:
         pass
+    index_current = file_exists and index_is_current()
 
     with open(RESPONSES_FILE, "a", newline="") as file:
         writer = csv.writer(file)
@@ -64,8 +76,68 @@ def save_responses(data):
             for section, questions in SURVEY_QUESTIONS.items():
                 headers.extend([f"{section}: {q}" for q in questions])
             writer.writerow(headers)
+        file.flush()
+        offset = file.tell()
         writer.writerow(data)
 
+    # Responses are appended in time order, so the index stays sorted. A new
+    # file starts a new index; a missing or stale one is left for the next
+    # query to rebuild rather than appended to.
+    if not file_exists or index_current:
+        with open(INDEX_FILE, "w" if not file_exists else "a", newline="") as file:
+            csv.writer(file).writerow([data[4], offset])
+
+def index_is_current():
+    try:
+        if os.path.getmtime(INDEX_FILE) < os.path.getmtime(RESPONSES_FILE):
+            return False
+        with open(INDEX_FILE, "rb") as file:
+            file.seek(max(0, os.path.getsize(INDEX_FILE) - 64))
+            lines = file.read().splitlines()
+        return not lines or int(lines[-1].rsplit(b",", 1)[1]) < os.path.getsize(RESPONSES_FILE)
+    except (FileNotFoundError, ValueError, IndexError):
+        return False
+
+def build_time_index():
+    timestamps = []
+    offsets = []
+    with open(RESPONSES_FILE, "rb") as file:
+        file.readline()
+        offset = file.tell()
+        for line in iter(file.readline, b""):
+            row = next(csv.reader([line.decode()]), [])
+            if len(row) > 4 and row[4]:
+                timestamps.append(row[4])
+                offsets.append(offset)
+            offset = file.tell()
+
+    with open(INDEX_FILE, "w", newline="") as file:
+        csv.writer(file).writerows(zip(timestamps, offsets))
+    return timestamps, offsets
+
+def load_time_index():
+    if index_is_current():
+        with open(INDEX_FILE, newline="") as file:
+            rows = list(csv.reader(file))
+        return [row[0] for row in rows], [int(row[1]) for row in rows]
+    return build_time_index()
+
+def window_bounds(timestamps, start=None, end=None):
+    lo = bisect_left(timestamps, start.strftime(TIMESTAMP_FORMAT)) if start else 0
+    hi = bisect_left(timestamps, end.strftime(TIMESTAMP_FORMAT)) if end else len(timestamps)
+    return lo, max(lo, hi)
+
+def read_rows(file, offsets, lo, hi):
+    # Returns the header plus rows lo..hi as CSV bytes, seeking straight to them.
+    file.seek(0)
+    header = file.readline()
+    if lo >= hi:
+        return header
+    file.seek(offsets[lo])
+    if hi < len(offsets):
+        return header + file.read(offsets[hi] - offsets[lo])
+    return header + file.read()
+
 def validate_input(prompt, valid_values=None, required=True):
     while True:
         response = input(prompt).strip()
@@ -103,7 +175,7 @@ def conduct_survey():
             answer = validate_input("Your answer (1-4): ", ["1", "2", "3", "4"])
             survey_answers.append(int(answer))
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
     save_responses(demographic_data + [timestamp] + survey_answers)
     print("\nThank you! Your responses have been recorded.\n")
 
@@ -133,10 +205,75 @@ def show_graphs(df):
     plt.tight_layout()
     plt.show()
 
-def analyze_results():
+def answer_moments(df):
+    # Item sums and the cross-product matrix of the answer block, from which
+    # every section's covariances are derived.
+    answers = df.iloc[:, 5:5 + ITEM_COUNT].fillna(0).to_numpy(dtype=np.int64)
+    return len(answers), answers.sum(axis=0), answers.T @ answers
+
+def reliability_from_moments(n, sums, cross):
+    if n < 2:
+        return {}
+
+    means = sums / n
+    cov = (cross - n * np.outer(means, means)) / (n - 1)
+
+    reliability = {}
+    index = 0
+    for section, questions in SURVEY_QUESTIONS.items():
+        k = len(questions)
+        block = cov[index:index + k, index:index + k]
+        item_var = np.diag(block)
+        total_var = block.sum()
+        row_sums = block.sum(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = k / (k - 1) * (1 - item_var.sum() / total_var)
+            # Corrected item-total: each item against the sum of the others.
+            item_total = (row_sums - item_var) / np.sqrt(item_var * (total_var - 2 * row_sums + item_var))
+            sd = np.sqrt(item_var)
+            correlations = block / np.outer(sd, sd)
+
+        reliability[section] = {
+            "alpha": alpha,
+            "item_total": pd.Series(item_total, index=questions),
+            "correlations": pd.DataFrame(correlations, index=questions, columns=questions)
+        }
+        index += k
+
+    return reliability
+
+def save_reliability(reliability):
+    item_rows = []
+    correlation_rows = []
+    for section, stats in reliability.items():
+        for question, value in stats["item_total"].items():
+            item_rows.append([section, question, round(stats["alpha"], 3), round(value, 3)])
+        matrix = stats["correlations"]
+        for question_a in matrix.index:
+            for question_b in matrix.columns:
+                correlation_rows.append([section, question_a, question_b, round(matrix.at[question_a, question_b], 3)])
+
+    pd.DataFrame(item_rows, columns=["Section", "Question", "Cronbach's Alpha", "Item-Total Correlation"]) \
+        .to_csv(RELIABILITY_FILE, index=False)
+    pd.DataFrame(correlation_rows, columns=["Section", "Question A", "Question B", "Correlation"]) \
+        .to_csv(CORRELATIONS_FILE, index=False)
+
+def analyze_results(start=None, end=None):
     try:
-        df = pd.read_csv(RESPONSES_FILE)
+        if start or end:
+            timestamps, offsets = load_time_index()
+            lo, hi = window_bounds(timestamps, start, end)
+            with open(RESPONSES_FILE, "rb") as file:
+                data = read_rows(file, offsets, lo, hi)
+        else:
+            data = None
+
+        df = pd.read_csv(io.BytesIO(data) if data is not None else RESPONSES_FILE)
         print(f"\nTotal Participants: {len(df)}")
+        if df.empty:
+            print("\nNo responses were recorded in the selected period.")
+            return
 
         df.dropna(how='all', inplace=True)
 
@@ -173,6 +310,13 @@ def analyze_results():
         overall = round(statistics.mean(section_means.values()), 2)
         print(f"\nOverall Mean: {overall}")
 
+        reliability = reliability_from_moments(*answer_moments(df))
+        if reliability:
+            print("\nReliability (Cronbach's Alpha):")
+            for section, stats in reliability.items():
+                print(f"{section}: {round(stats['alpha'], 3)}")
+            save_reliability(reliability)
+
         print("\nInterpretation:")
         print("The data shows that AI tools positively influence student performance and engagement.")
 
@@ -184,6 +328,57 @@ def analyze_results():
     except Exception as e:
         print(f"\nError during analysis: {e}")
 
+def analyze_trends(period="daily"):
+    try:
+        timestamps, offsets = load_time_index()
+        if not timestamps:
+            print("\nNo data found. Please run the survey first.")
+            return
+
+        step = timedelta(days=1 if period == "daily" else 7)
+        window_start = datetime.strptime(timestamps[0][:10], "%Y-%m-%d")
+        if period == "weekly":
+            window_start -= timedelta(days=window_start.weekday())
+        last = datetime.strptime(timestamps[-1], TIMESTAMP_FORMAT)
+
+        rows = []
+        with open(RESPONSES_FILE, "rb") as file:
+            while window_start <= last:
+                window_end = window_start + step
+                lo, hi = window_bounds(timestamps, window_start, window_end)
+                if lo < hi:
+                    df = pd.read_csv(io.BytesIO(read_rows(file, offsets, lo, hi)))
+                    df.dropna(how='all', inplace=True)
+                    row = [window_start.strftime("%Y-%m-%d"), len(df)]
+                    index = 0
+                    for questions in SURVEY_QUESTIONS.values():
+                        scores = df.iloc[:, 5 + index:5 + index + len(questions)].fillna(0).astype(float)
+                        row.append(round(scores.mean().mean(), 2))
+                        index += len(questions)
+                    rows.append(row)
+                window_start = window_end
+
+        trend_df = pd.DataFrame(rows, columns=["Window", "Responses"] + list(SURVEY_QUESTIONS))
+        trend_df.to_csv(TRENDS_FILE, index=False)
+
+        print(f"\n{period.capitalize()} Section Averages:")
+        print(trend_df.to_string(index=False))
+
+    except FileNotFoundError:
+        print("\nNo data found. Please run the survey first.")
+    except Exception as e:
+        print(f"\nError during trend analysis: {e}")
+
+def input_date(prompt):
+    while True:
+        response = input(prompt).strip()
+        if not response:
+            return None
+        try:
+            return datetime.strptime(response, "%Y-%m-%d")
+        except ValueError:
+            print("Invalid date. Please use the format YYYY-MM-DD.")
+
 def print_credits():
     print("\n--- Researcher Credits ---")
     print("Research Title: The Effectiveness of AI Tools in Improving the Academic Performance of Computer Science Students")
@@ -197,17 +392,26 @@ def main():
         print("\n--- AI Tools and Academic Performance Survey ---")
         print("1. Conduct a new survey")
         print("2. See the Research Results")
-        print("3. View researcher credits")
-        print("4. Exit")
-        choice = validate_input("Choose an option (1-4): ", ["1", "2", "3", "4"])
+        print("3. See the Research Results for a date range")
+        print("4. See response trends over time")
+        print("5. View researcher credits")
+        print("6. Exit")
+        choice = validate_input("Choose an option (1-6): ", ["1", "2", "3", "4", "5", "6"])
 
         if choice == "1":
             conduct_survey()
         elif choice == "2":
             analyze_results()
         elif choice == "3":
-            print_credits()
+            start = input_date("Start date (YYYY-MM-DD, blank for earliest): ")
+            end = input_date("End date (YYYY-MM-DD, blank for latest): ")
+            analyze_results(start, end + timedelta(days=1) if end else None)
         elif choice == "4":
+            period = validate_input("Group by (daily/weekly): ", ["daily", "weekly"])
+            analyze_trends(period)
+        elif choice == "5":
+            print_credits()
+        elif choice == "6":
             print("\nThank you! Goodbye.")
             break
 